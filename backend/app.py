@@ -3,6 +3,7 @@ Allspace — Floor Plan to 3D Model Converter
 Flask backend API
 """
 
+import logging
 import os
 import uuid
 from datetime import datetime, timedelta
@@ -16,6 +17,14 @@ from models.depth_estimator import DepthEstimator
 from utils.mesh_generator import MeshGenerator
 from utils.exporter import ModelExporter
 
+# Pipeline modules log through the logging module (lazy %-formatting keeps
+# the hot mesh/export paths free of f-string work when the level is off).
+# Default to the chatty dev behaviour; set ALLSPACE_LOG_LEVEL to quieten.
+logging.basicConfig(
+    level=os.environ.get('ALLSPACE_LOG_LEVEL', 'DEBUG').upper(),
+    format='%(message)s',
+)
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend communication
 
@@ -214,14 +223,13 @@ def generate_combined():
             generate_interiors=options['generate_interiors'],
         )
 
-        glb_path = os.path.join(app.config['OUTPUT_FOLDER'], f"{job_id}.glb")
-        model_exporter.export_glb(base_mesh, glb_path, image_data)
-
         # OBJ is the engine-friendly secondary format. trimesh cannot write FBX,
         # so the previous .fbx output was always a broken/empty link; OBJ imports
-        # cleanly into Unity, Unreal and Blender.
-        obj_path = os.path.join(app.config['OUTPUT_FOLDER'], f"{job_id}.obj")
-        model_exporter.export_obj(base_mesh, obj_path, image_data)
+        # cleanly into Unity, Unreal and Blender. Both formats are written
+        # concurrently — the serialization work overlaps the disk I/O.
+        base_path = os.path.join(app.config['OUTPUT_FOLDER'], job_id)
+        model_exporter.export_all(base_mesh, base_path, image_data,
+                                  formats=('glb', 'obj'))
 
         generation_jobs[job_id] = {
             'status': 'completed',
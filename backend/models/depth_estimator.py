@@ -71,7 +71,26 @@ class DepthEstimator:
                 scene_type = force_scene_type
                 print(f"   🔒 Scene type forced: {scene_type}")
             else:
-                scene_type = self._detect_scene_type(img_gray, img_rgb, height, width)
+                # Classification reads resolution-invariant aggregates (means,
+                # bright-pixel fractions, saturation) and line counts whose
+                # Hough parameters scale with the passed width, so it runs on
+                # a bounded copy: at 1024px every reduction walks megabytes,
+                # at 512px they are cache-resident. Depth strategies below
+                # still get the full-resolution images.
+                det_max = 512
+                if max(height, width) > det_max:
+                    det_scale = det_max / max(height, width)
+                    det_w = int(width * det_scale)
+                    det_h = int(height * det_scale)
+                    gray_det = cv2.resize(img_gray, (det_w, det_h),
+                                          interpolation=cv2.INTER_AREA)
+                    rgb_det = cv2.resize(img_rgb, (det_w, det_h),
+                                         interpolation=cv2.INTER_AREA)
+                else:
+                    gray_det, rgb_det = img_gray, img_rgb
+                    det_w, det_h = width, height
+                scene_type = self._detect_scene_type(gray_det, rgb_det, det_h, det_w)
+                del gray_det, rgb_det
                 print(f"   🔍 Detected scene type: {scene_type}")
 
             # Compute edge map once (shared across scene types)
@@ -99,14 +118,14 @@ class DepthEstimator:
                       f"range {depth_map.min():.3f} – {depth_map.max():.3f}")
                 return depth_map, confidence_map, scene_type
 
-            elif scene_type == "indoor_room":
-                depth_map = self._indoor_depth(img_gray, img_rgb, height, width)
-            elif scene_type == "outdoor_landscape":
-                depth_map = self._landscape_depth(img_gray, img_rgb, height, width)
-            elif scene_type == "portrait":
-                depth_map = self._portrait_depth(img_gray, img_rgb, height, width)
             else:
-                depth_map = self._general_depth(img_gray, img_rgb, height, width)
+                # Remaining types share the blend/refine path below; dispatch
+                # by table so adding a scene type means one entry, not another
+                # elif in this method
+                strategy = self._BLEND_DEPTH_STRATEGIES.get(
+                    scene_type, DepthEstimator._general_depth
+                )
+                depth_map = strategy(self, img_gray, img_rgb, height, width)
 
             # Blend with edge-distance refinement (edges = depth discontinuities)
             depth_map = depth_map * 0.75 + edge_depth * 0.25
@@ -167,6 +186,36 @@ class DepthEstimator:
                       and top_brightness > mid_brightness + 15
                       and not white_throughout)
 
+        # ── Cheap floor-plan pre-pass ──────────────────────────────────────
+        # Brightness statistics alone settle the common floor-plan case: a
+        # mostly-white, high-contrast page with dark lines and no sky strip
+        # can only come out of the full decision tree as floor_plan, so
+        # return before any of the Canny/Hough and HSV work below runs.
+        # One SIMD pass for mean and std together (np.mean + np.std would
+        # each walk the full image separately)
+        mean_b, std_b = cv2.meanStdDev(img_gray)
+        avg_brightness = float(mean_b[0, 0])
+        std_brightness = float(std_b[0, 0])
+        dark_pixels  = np.sum(img_gray < 100)
+        light_pixels = np.sum(img_gray > 200)
+        total_pixels = img_gray.size
+
+        dark_ratio  = dark_pixels  / total_pixels
+        light_ratio = light_pixels / total_pixels
+
+        is_mostly_white           = avg_brightness > 170
+        is_high_contrast          = std_brightness > 35
+        has_significant_dark_lines  = 0.02 < dark_ratio < 0.5
+        has_significant_white_space = light_ratio > 0.35
+
+        strong_floor_plan = is_mostly_white and has_significant_white_space and is_high_contrast
+
+        if not sky_at_top and strong_floor_plan:
+            print(f"  📐 Floor plan detected (fast path)! "
+                  f"white={is_mostly_white}, contrast={is_high_contrast}, "
+                  f"dark_lines={has_significant_dark_lines}")
+            return "floor_plan"
+
         # ── Structural line analysis (shared by floor-plan and facade) ───────
         edges = cv2.Canny(img_gray, 50, 150)
         lines = cv2.HoughLinesP(
@@ -217,28 +266,14 @@ class DepthEstimator:
                   f"mid_sat={mid_saturation:.1f}, sky_ground_contrast={sky_ground_contrast:.1f}")
             return "building_facade"
 
-        # ── Floor plan detection ───────────────────────────────────────────
-        avg_brightness = float(np.mean(img_gray))
-        std_brightness = float(np.std(img_gray))
-        dark_pixels  = np.sum(img_gray < 100)
-        light_pixels = np.sum(img_gray > 200)
-        total_pixels = img_gray.size
-
-        dark_ratio  = dark_pixels  / total_pixels
-        light_ratio = light_pixels / total_pixels
-
-        is_mostly_white           = avg_brightness > 170
-        is_high_contrast          = std_brightness > 35
-        has_significant_dark_lines  = 0.02 < dark_ratio < 0.5
-        has_significant_white_space = light_ratio > 0.35
-
+        # ── Floor plan detection (brightness stats computed in the fast-path
+        #     pre-pass above) ──────────────────────────────────────────────
         conditions_met = sum([
             is_mostly_white and has_significant_white_space,
             is_high_contrast,
             has_significant_dark_lines,
             has_many_straight_lines,
         ])
-        strong_floor_plan = is_mostly_white and has_significant_white_space and is_high_contrast
 
         # A monochrome drawing (low saturation) with uniform white background is
         # almost certainly a floor plan, even if it accidentally triggers sky_at_top.
@@ -588,6 +623,16 @@ class DepthEstimator:
                  + saturation * 0.15 + brightness * 0.10)
         return depth
 
+    # Scene types that share the blend/refine path in estimate_depth, mapped
+    # to their depth strategy. floor_plan and building_facade return early
+    # and are dispatched explicitly above.
+    _BLEND_DEPTH_STRATEGIES = {
+        "indoor_room": _indoor_depth,
+        "outdoor_landscape": _landscape_depth,
+        "portrait": _portrait_depth,
+        "general": _general_depth,
+    }
+
     def _normalize(self, array):
         """Normalize array to 0-1 range"""
         array = array.astype(np.float32)
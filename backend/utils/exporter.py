@@ -4,16 +4,21 @@ Exports 3D meshes to various formats (GLB, FBX, OBJ) using trimesh
 """
 
 import os
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import numpy as np
 import trimesh
 from PIL import Image
 
+log = logging.getLogger(__name__)
+
 
 class ModelExporter:
     """Exports 3D models to various formats compatible with Unity, Unreal, Blender"""
 
     def __init__(self):
-        print("🔧 Initializing Model Exporter (trimesh-based)")
+        log.debug("🔧 Initializing Model Exporter (trimesh-based)")
 
     def export_glb(self, mesh, output_path, image_data=None):
         """
@@ -22,75 +27,124 @@ class ModelExporter:
         + vertex-coloured sides on building facades).
         """
         try:
-            print(f"  📦 Exporting GLB to {output_path}")
+            log.debug("  📦 Exporting GLB to %s", output_path)
 
             if not self._validate_mesh(mesh):
-                print(f"  ❌ Mesh validation failed")
+                log.error("  ❌ Mesh validation failed")
                 return False
 
             # trimesh.Scene and trimesh.Trimesh both support .export()
-            if not isinstance(mesh, trimesh.Scene) and not mesh.is_watertight:
-                print(f"  ⚠️  Mesh is not watertight (expected for depth-based meshes)")
-
             mesh.export(output_path, file_type='glb')
 
             if os.path.exists(output_path):
                 file_size = os.path.getsize(output_path)
-                print(f"  ✅ GLB exported successfully ({file_size} bytes)")
+                log.debug("  ✅ GLB exported successfully (%s bytes)", file_size)
                 return file_size > 0
             else:
-                print(f"  ❌ GLB file was not created")
+                log.error("  ❌ GLB file was not created")
                 return False
 
         except Exception as e:
-            print(f"  ❌ Error exporting GLB: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("  ❌ Error exporting GLB: %s", e)
             return False
 
+    def export_all(self, mesh, base_path, image_data=None, formats=('glb', 'obj')):
+        """
+        Export mesh to several formats concurrently.
+
+        The per-format exports are independent and largely I/O-bound (the GIL
+        is released inside trimesh serialization and file writes), so running
+        them on a small thread pool overlaps the disk time.
+
+        Args:
+            mesh: Trimesh or trimesh.Scene object
+            base_path: Output path without extension (e.g. "outputs/<job_id>")
+            image_data: Optional texture image passed through to each exporter
+            formats: Iterable of format names ('glb', 'obj', 'ply'). 'fbx' is
+                accepted but exported as OBJ — trimesh has no FBX writer —
+                and reported under 'obj' in the results.
+
+        Returns:
+            results: Dict mapping format name -> success boolean
+        """
+        exporters = {
+            'glb': self.export_glb,
+            'obj': self.export_obj,
+            'ply': lambda m, p, _img=None: self.export_ply(m, p),
+        }
+        results = {}
+        # Resolve formats up front so no two workers ever target the same
+        # file: a requested 'fbx' would always fall back to "<base>.obj"
+        # inside export_fbx, racing a concurrent 'obj' job over one path.
+        requested = []
+        for fmt in formats:
+            fmt = fmt.lower()
+            if fmt == 'fbx':
+                log.warning("  ⚠️  FBX is not writable by trimesh — exporting OBJ instead")
+                fmt = 'obj'
+            if fmt not in exporters:
+                results[fmt] = False
+                continue
+            if fmt not in requested:
+                requested.append(fmt)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = {
+                pool.submit(exporters[fmt], mesh, f"{base_path}.{fmt}", image_data): fmt
+                for fmt in requested
+            }
+            for future in as_completed(futures):
+                fmt = futures[future]
+                try:
+                    results[fmt] = bool(future.result())
+                except Exception as e:
+                    log.error("  ❌ %s export raised: %s", fmt.upper(), e)
+                    results[fmt] = False
+        return results
+
     def _validate_mesh(self, mesh):
         """Validate mesh (Trimesh or Scene) has valid geometry"""
         try:
             # ── trimesh.Scene validation ──────────────────────────────────
             if isinstance(mesh, trimesh.Scene):
                 if len(mesh.geometry) == 0:
-                    print(f"  ❌ Scene has no geometry")
+                    log.error("  ❌ Scene has no geometry")
                     return False
                 total_v = sum(len(g.vertices) for g in mesh.geometry.values())
                 total_f = sum(len(g.faces)    for g in mesh.geometry.values())
                 if total_v == 0 or total_f == 0:
-                    print(f"  ❌ Scene has empty geometry")
+                    log.error("  ❌ Scene has empty geometry")
                     return False
-                all_verts = np.concatenate(
-                    [g.vertices for g in mesh.geometry.values()], axis=0
-                )
-                if np.isnan(all_verts).any() or np.isinf(all_verts).any():
-                    print(f"  ❌ Scene has NaN/Inf vertices")
+                # Check each geometry in place — concatenating every vertex
+                # array just to scan it would copy the whole scene
+                if not all(np.isfinite(g.vertices).all()
+                           for g in mesh.geometry.values()):
+                    log.error("  ❌ Scene has NaN/Inf vertices")
                     return False
-                print(f"  ✅ Scene validation passed: {len(mesh.geometry)} meshes, "
-                      f"{total_v} vertices, {total_f} faces")
+                log.debug("  ✅ Scene validation passed: %d meshes, %d vertices, %d faces",
+                          len(mesh.geometry), total_v, total_f)
                 return True
 
             # ── Single Trimesh validation ─────────────────────────────────
             if len(mesh.vertices) == 0:
-                print(f"  ❌ Mesh has no vertices"); return False
+                log.error("  ❌ Mesh has no vertices"); return False
             if len(mesh.faces) == 0:
-                print(f"  ❌ Mesh has no faces"); return False
-            if np.isnan(mesh.vertices).any():
-                print(f"  ❌ Mesh has NaN vertices"); return False
-            if np.isinf(mesh.vertices).any():
-                print(f"  ❌ Mesh has Inf vertices"); return False
-
-            v_min, v_max = mesh.vertices.min(), mesh.vertices.max()
+                log.error("  ❌ Mesh has no faces"); return False
+            # One fused finite check instead of separate isnan + isinf passes
+            if not np.isfinite(mesh.vertices).all():
+                log.error("  ❌ Mesh has NaN/Inf vertices"); return False
+
+            # mesh.bounds is cached by trimesh, so the range check costs
+            # nothing when something downstream already asked for it
+            v_min, v_max = mesh.bounds[0].min(), mesh.bounds[1].max()
             if v_max - v_min > 10000:
-                print(f"  ⚠️  Mesh has very large range: {v_max - v_min:.2f}")
+                log.warning("  ⚠️  Mesh has very large range: %.2f", v_max - v_min)
 
-            print(f"  ✅ Mesh validation passed: {len(mesh.vertices)} vertices, "
-                  f"{len(mesh.faces)} faces | bounds [{v_min:.2f}, {v_max:.2f}]")
+            log.debug("  ✅ Mesh validation passed: %d vertices, %d faces | bounds [%.2f, %.2f]",
+                      len(mesh.vertices), len(mesh.faces), v_min, v_max)
             return True
 
         except Exception as e:
-            print(f"  ❌ Mesh validation error: {e}")
+            log.error("  ❌ Mesh validation error: %s", e)
             return False
 
     def export_fbx(self, mesh, output_path, image_data=None):
@@ -100,21 +154,21 @@ class ModelExporter:
         trimesh FBX export does not support Scene graphs.
         """
         try:
-            print(f"  📦 Exporting FBX to {output_path}")
+            log.debug("  📦 Exporting FBX to %s", output_path)
 
             # trimesh Scene → FBX is not supported; use OBJ instead
             if isinstance(mesh, trimesh.Scene):
-                print(f"  ⚠️  FBX does not support multi-mesh scenes. Exporting as OBJ.")
+                log.warning("  ⚠️  FBX does not support multi-mesh scenes. Exporting as OBJ.")
                 obj_path = output_path.replace('.fbx', '.obj')
                 return self.export_obj(mesh, obj_path, image_data)
 
             mesh.export(output_path, file_type='fbx')
-            print(f"  ✅ FBX exported successfully")
+            log.debug("  ✅ FBX exported successfully")
             return True
 
         except Exception as e:
-            print(f"  ❌ Error exporting FBX: {e}")
-            print(f"  ⚠️  Falling back to OBJ export.")
+            log.error("  ❌ Error exporting FBX: %s", e)
+            log.warning("  ⚠️  Falling back to OBJ export.")
             obj_path = output_path.replace('.fbx', '.obj')
             return self.export_obj(mesh, obj_path, image_data)
 
@@ -131,16 +185,16 @@ class ModelExporter:
             success: Boolean
         """
         try:
-            print(f"  📦 Exporting OBJ to {output_path}")
+            log.debug("  📦 Exporting OBJ to %s", output_path)
 
             # Trimesh has native OBJ export
             mesh.export(output_path, file_type='obj')
 
-            print(f"  ✅ OBJ exported successfully")
+            log.debug("  ✅ OBJ exported successfully")
             return True
 
         except Exception as e:
-            print(f"  ❌ Error exporting OBJ: {e}")
+            log.error("  ❌ Error exporting OBJ: %s", e)
             return False
 
     def export_ply(self, mesh, output_path):
@@ -158,7 +212,7 @@ class ModelExporter:
             mesh.export(output_path, file_type='ply')
             return True
         except Exception as e:
-            print(f"  ❌ Error exporting PLY: {e}")
+            log.error("  ❌ Error exporting PLY: %s", e)
             return False
 
     def add_texture_to_mesh(self, mesh, texture_image_path):
@@ -182,7 +236,7 @@ class ModelExporter:
             return mesh
 
         except Exception as e:
-            print(f"  ⚠️  Could not add texture: {e}")
+            log.warning("  ⚠️  Could not add texture: %s", e)
             return mesh
 
     def optimize_for_unity(self, mesh):
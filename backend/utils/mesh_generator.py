@@ -3,18 +3,118 @@ Mesh Generation Module
 Creates 3D meshes from depth maps and images using trimesh (no Open3D required)
 """
 
+import logging
+import os
+from functools import lru_cache
+
 import numpy as np
 import cv2
 import trimesh
-from scipy.spatial import Delaunay
 from PIL import Image
 
+log = logging.getLogger(__name__)
+
+# Triangle-index templates shared by every quad emitter in this module: two
+# CCW triangles over a 0-1-2-3 quad, and the wall-segment variants (outer
+# quad + reversed inner quad at +4, optionally a top cap at +8). Built once
+# at import instead of re-parsing the nested lists on every call.
+_QUAD_TRIS = np.array([[0, 1, 2], [0, 2, 3]], dtype=np.int32)
+_WALL_TRIS = np.concatenate([_QUAD_TRIS, [[6, 5, 4], [7, 6, 4]]]).astype(np.int32)
+_WALL_TRIS_CAPPED = np.concatenate([_WALL_TRIS, _QUAD_TRIS + 8]).astype(np.int32)
+for _tmpl in (_QUAD_TRIS, _WALL_TRIS, _WALL_TRIS_CAPPED):
+    _tmpl.setflags(write=False)
+
+# Architect-friendly room palette: warm, distinct, low-saturation tones.
+# Row 0 is the unlabelled background floor; rooms get rows 1+ largest-first.
+_ROOM_PALETTE = np.array([
+    [232, 218, 200],  # tan — unlabelled background floor
+    [248, 238, 220],  # cream — living / main room
+    [218, 232, 246],  # sky blue — bedroom
+    [228, 244, 222],  # sage — kitchen / dining
+    [246, 232, 220],  # peach — bedroom 2
+    [234, 220, 246],  # lavender — study / office
+    [220, 244, 238],  # mint — bathroom
+    [244, 240, 218],  # pale gold — utility / laundry
+], dtype=np.uint8)
+_ROOM_PALETTE.setflags(write=False)
+
+_WALL_FALLBACK_COLOR = [120, 120, 120]  # when contour color sampling fails
+_SLAB_COLOR = [230, 215, 190]           # warm-beige slab when interiors are off
+
+# Make sure OpenCV's optimized (SIMD) code paths are on — some builds ship
+# with them disabled — and cap its internal thread pool. Half the cores is a
+# good default next to Flask's own threading on the small deploy targets;
+# override with ALLSPACE_CV_THREADS if the host has headroom.
+cv2.setUseOptimized(True)
+cv2.setNumThreads(int(os.environ.get('ALLSPACE_CV_THREADS',
+                                     max(1, (os.cpu_count() or 2) // 2))))
+
+
+@lru_cache(maxsize=8)
+def _grid_coords(width, height):
+    """
+    Normalized, flattened vertex coordinates for a (height, width) heightmap.
+
+    These depend only on the grid dimensions, which are fixed per working
+    resolution, so they are computed once and shared across calls (cached
+    read-only to keep them safe to share). Built from 1-D vectors with
+    tile/repeat — no meshgrid and no 2-D temporaries.
+
+    Returns:
+        x_flat: (W*H,) float32 X column in the -1..1 range
+        y_flat: (W*H,) float32 Y column (image Y flipped so top → +Y)
+    """
+    xs = (np.arange(width, dtype=np.float32) - width / 2.0) / (width / 2.0)
+    ys = -(np.arange(height, dtype=np.float32) - height / 2.0) / (height / 2.0)
+
+    x_flat = np.tile(xs, height)
+    y_flat = np.repeat(ys, width)
+    x_flat.setflags(write=False)
+    y_flat.setflags(write=False)
+    return x_flat, y_flat
+
+
+@lru_cache(maxsize=8)
+def _grid_topology(width, height):
+    """
+    Per-vertex UVs and triangle indices for a (height, width) heightmap grid.
+
+    Like _grid_coords these are pure functions of the resolution, so they are
+    built once and shared read-only across mesh builds.
+
+    Returns:
+        uv_coords: (W*H, 2) float32 UVs (V flipped for OpenGL convention)
+        faces: (2*(W-1)*(H-1), 3) int32 triangle indices (CCW winding, Y-up)
+    """
+    # UV coordinates (u=0..1 left→right, v=0..1 top→bottom for image space)
+    u = np.tile(np.linspace(0.0, 1.0, width, dtype=np.float32), height)
+    v = np.repeat(np.linspace(0.0, 1.0, height, dtype=np.float32), width)
+    uv_coords = np.stack([u, 1.0 - v], axis=1)
+
+    # Face index array, vectorised (much faster than a Python loop)
+    row_idx = np.arange(height - 1)
+    col_idx = np.arange(width - 1)
+    rr, cc = np.meshgrid(row_idx, col_idx, indexing='ij')
+    v0 = (rr * width + cc).flatten()
+    v1 = v0 + 1
+    v2 = v0 + width
+    v3 = v0 + width + 1
+    # Two triangles per quad
+    faces = np.concatenate([
+        np.stack([v0, v1, v2], axis=1),
+        np.stack([v1, v3, v2], axis=1)
+    ], axis=0).astype(np.int32)
+
+    uv_coords.setflags(write=False)
+    faces.setflags(write=False)
+    return uv_coords, faces
+
 
 class MeshGenerator:
     """Generates 3D meshes from 2D images and depth maps"""
 
     def __init__(self):
-        print("🔧 Initializing Mesh Generator (trimesh-based)")
+        log.debug("🔧 Initializing Mesh Generator (trimesh-based)")
 
     def create_mesh_from_depth(self, image_path, depth_map, confidence_map=None,
                                scene_type=None, scale_factor_x=1.0, scale_factor_z=1.0,
@@ -32,44 +132,52 @@ class MeshGenerator:
             image_data: Original image data for texturing
         """
         try:
-            # Load image (match depth map dimensions for vertex color fallback)
-            image = cv2.imread(image_path)
-            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            # Load image (match depth map dimensions for vertex color fallback).
+            # PIL decodes straight to RGB — avoids cv2's BGR load followed by a
+            # full-image cvtColor copy just to swap channels.
+            with Image.open(image_path) as pil_img:
+                image = np.asarray(pil_img.convert('RGB'))
 
             # Resize image to match depth map dimensions
             dh, dw = depth_map.shape
             if image.shape[:2] != (dh, dw):
                 image = cv2.resize(image, (dw, dh), interpolation=cv2.INTER_LANCZOS4)
 
-            image_data = image.copy()
+            # Hand the caller a read-only view instead of a full HxWx3 copy —
+            # the exporter only reads the texture data. (np.asarray on a PIL
+            # image is already non-writeable; the resize branch re-enables it.)
+            image.setflags(write=False)
+            image_data = image
             height, width = depth_map.shape
 
             # Choose mesh strategy based on scene type (or fall back to heuristic)
             if scene_type == "building_facade":
-                print("  🏠 Building facade - creating extruded box model")
+                log.debug("  🏠 Building facade - creating extruded box model")
                 mesh = self._facade_box_mesh(
                     depth_map, image, width, height, image_path=image_path
                 )
             elif scene_type == "floor_plan":
-                print("  🏗️  Floor plan - using architectural wall extrusion")
+                log.debug("  🏗️  Floor plan - using architectural wall extrusion")
                 mesh = self._architectural_mesh(depth_map, image, width, height,
                                                 scale_factor_x=scale_factor_x,
                                                 scale_factor_z=scale_factor_z,
                                                 complexity=complexity,
                                                 generate_interiors=generate_interiors)
             else:
-                # Heuristic fallback for scenes whose type isn't propagated
-                low_depth  = np.sum((depth_map >= 0.0) & (depth_map < 0.2)) / depth_map.size
-                high_depth = np.sum((depth_map >= 0.8) & (depth_map <= 1.0)) / depth_map.size
+                # Heuristic fallback for scenes whose type isn't propagated.
+                # One histogram pass instead of two boolean-mask scans.
+                counts, _ = np.histogram(depth_map, bins=[0.0, 0.2, 0.8, 1.0 + 1e-6])
+                low_depth  = counts[0] / depth_map.size
+                high_depth = counts[2] / depth_map.size
                 if (low_depth + high_depth) > 0.6:
-                    print("  🏗️  Floor plan heuristic - architectural wall extrusion")
+                    log.debug("  🏗️  Floor plan heuristic - architectural wall extrusion")
                     mesh = self._architectural_mesh(depth_map, image, width, height,
                                                     scale_factor_x=scale_factor_x,
                                                     scale_factor_z=scale_factor_z,
                                                     complexity=complexity,
                                                     generate_interiors=generate_interiors)
                 else:
-                    print("  📸 Photo mode - heightmap mesh with UV texture")
+                    log.debug("  📸 Photo mode - heightmap mesh with UV texture")
                     mesh = self._depth_to_mesh(
                         depth_map, image, width, height, confidence_map,
                         image_path=image_path
@@ -78,20 +186,52 @@ class MeshGenerator:
             if isinstance(mesh, trimesh.Scene):
                 total_v = sum(len(g.vertices) for g in mesh.geometry.values())
                 total_f = sum(len(g.faces)    for g in mesh.geometry.values())
-                print(f"✅ Generated facade scene: {len(mesh.geometry)} meshes, "
-                      f"{total_v} vertices, {total_f} faces")
+                log.debug("✅ Generated facade scene: %d meshes, %d vertices, %d faces",
+                          len(mesh.geometry), total_v, total_f)
             else:
-                print(f"✅ Generated base mesh: {len(mesh.vertices)} vertices, "
-                      f"{len(mesh.faces)} faces")
+                log.debug("✅ Generated base mesh: %d vertices, %d faces",
+                          len(mesh.vertices), len(mesh.faces))
 
             return mesh, image_data
 
         except Exception as e:
-            print(f"❌ Error creating mesh: {e}")
+            log.error("❌ Error creating mesh: %s", e)
             raise
 
+    def create_meshes_batch(self, items, max_workers=None):
+        """
+        Build meshes for a batch of images on a thread pool.
+
+        Per-image jobs are independent and the heavy steps (cv2 resize and
+        filtering, NumPy reductions, image decode) release the GIL, so batch
+        conversion parallelizes well across threads.
+
+        Args:
+            items: Iterable of keyword-argument dicts for create_mesh_from_depth
+                   (each needs at least image_path and depth_map)
+            max_workers: Optional thread count (defaults to the executor's)
+
+        Returns:
+            results: List of (mesh, image_data) tuples in input order;
+                     a failed item yields None in its slot
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        items = list(items)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(self.create_mesh_from_depth, **kwargs)
+                       for kwargs in items]
+            results = []
+            for i, future in enumerate(futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    log.error("❌ Batch item %d failed: %s", i, e)
+                    results.append(None)
+        return results
+
     def _depth_to_mesh(self, depth_map, image, width, height, confidence_map=None,
-                       image_path=None):
+                       image_path=None, depth_gap_threshold=None):
         """
         Convert depth map to a UV-textured 3D heightmap mesh.
 
@@ -104,10 +244,38 @@ class MeshGenerator:
             width, height: Image dimensions
             confidence_map: Optional confidence values
             image_path: Path to original image for high-quality texture
+            depth_gap_threshold: Optional max depth spread within a quad;
+                quads spanning a larger discontinuity are dropped instead of
+                rendered as stretched "rubber sheet" triangles. None (default)
+                keeps the full grid.
 
         Returns:
             mesh: Trimesh object with UV texture or vertex colors
         """
+        # float32 end-to-end: estimator output is already float32, but guard
+        # against float64 inputs doubling bandwidth through the whole build
+        depth_map = depth_map.astype(np.float32, copy=False)
+
+        # Crop away regions the confidence map marks as void before building
+        # anything — vertex count and all later passes shrink with the bbox.
+        # (The built-in estimator never drops below 0.3, so this only kicks in
+        # for callers supplying sparse/masked confidence maps.)
+        if confidence_map is not None:
+            ys, xs = np.where(confidence_map > 0.3)
+            if len(ys) and (ys.min() > 0 or xs.min() > 0
+                            or ys.max() < height - 1 or xs.max() < width - 1):
+                y0, y1 = int(ys.min()), int(ys.max()) + 1
+                x0, x1 = int(xs.min()), int(xs.max()) + 1
+                log.debug("  ✂️  Cropping to confident bbox: rows %d:%d, cols %d:%d",
+                          y0, y1, x0, x1)
+                depth_map = depth_map[y0:y1, x0:x1]
+                image = image[y0:y1, x0:x1]
+                confidence_map = confidence_map[y0:y1, x0:x1]
+                height, width = depth_map.shape
+                # Full-image UVs no longer line up with the cropped grid, so
+                # fall back to vertex colors sampled from the cropped image
+                image_path = None
+
         # Determine target mesh resolution (stay under 512MB)
         max_dimension = max(width, height)
         if max_dimension > 512:
@@ -117,7 +285,7 @@ class MeshGenerator:
             target_w, target_h = width, height
 
         if target_w != width or target_h != height:
-            print(f"  🔽 Downsampling mesh {width}x{height} → {target_w}x{target_h} (INTER_AREA)")
+            log.debug("  🔽 Downsampling mesh %sx%s → %sx%s (INTER_AREA)", width, height, target_w, target_h)
             # INTER_AREA averages pixels correctly (no aliasing vs stride slicing)
             depth_map = cv2.resize(depth_map, (target_w, target_h),
                                    interpolation=cv2.INTER_AREA)
@@ -128,61 +296,50 @@ class MeshGenerator:
                                             interpolation=cv2.INTER_AREA)
             width, height = target_w, target_h
 
-        print(f"  ✅ Mesh resolution: {width}x{height} = {width * height} vertices")
+        log.debug("  ✅ Mesh resolution: %sx%s = %s vertices", width, height, width * height)
 
         # Pre-process depth: bilateral filter smooths flat regions while
         # keeping hard depth edges (object boundaries) sharp
         depth_smooth = cv2.bilateralFilter(
-            depth_map.astype(np.float32), d=7, sigmaColor=0.05, sigmaSpace=7
+            depth_map, d=7, sigmaColor=0.05, sigmaSpace=7
         )
 
         # Stronger depth scale for clearly visible 3D effect
         depth_scale = 1.5
 
         # Build vertex positions on a regular grid
-        # Coordinate system: X=right, Y=up (from image), Z=depth
-        x = np.arange(0, width, dtype=np.float32)
-        y = np.arange(0, height, dtype=np.float32)
-        x_grid, y_grid = np.meshgrid(x, y)
-
-        x_norm = (x_grid - width / 2.0) / (width / 2.0)   # -1 to 1
-        y_norm = (y_grid - height / 2.0) / (height / 2.0)  # -1 to 1
-
-        z = depth_smooth * depth_scale
-
-        # Stack into Nx3 vertex array (Y-up: flip image Y so top→positive)
-        vertices = np.stack([
-            x_norm.flatten(),
-            -y_norm.flatten(),   # flip: image row 0 = top = +Y in 3D
-            z.flatten()
-        ], axis=1).astype(np.float32)
-
-        # UV coordinates (u=0..1 left→right, v=0..1 top→bottom for image space)
-        u = (x_grid / (width - 1)).flatten().astype(np.float32)
-        v = (y_grid / (height - 1)).flatten().astype(np.float32)
-        uv_coords = np.stack([u, 1.0 - v], axis=1)  # flip V for OpenGL convention
-
-        # Build face index array vectorised (much faster than Python loop)
-        row_idx = np.arange(height - 1)
-        col_idx = np.arange(width - 1)
-        rr, cc = np.meshgrid(row_idx, col_idx, indexing='ij')
-        v0 = (rr * width + cc).flatten()
-        v1 = v0 + 1
-        v2 = v0 + width
-        v3 = v0 + width + 1
-        # Two triangles per quad (counter-clockwise winding, Y-up)
-        faces = np.concatenate([
-            np.stack([v0, v1, v2], axis=1),
-            np.stack([v1, v3, v2], axis=1)
-        ], axis=0).astype(np.int32)
+        # Coordinate system: X=right, Y=up (from image), Z=depth.
+        # One (N, 3) allocation filled column-wise — the cached coordinate
+        # columns are copied in and depth is scaled straight into the Z column.
+        x_flat, y_flat = _grid_coords(width, height)
+        vertices = np.empty((height * width, 3), dtype=np.float32)
+        vertices[:, 0] = x_flat
+        vertices[:, 1] = y_flat
+        np.multiply(depth_smooth.ravel(), depth_scale, out=vertices[:, 2])
+
+        # Grid topology (faces) and UVs depend only on the resolution — cached
+        uv_coords, faces = _grid_topology(width, height)
+
+        # Optionally drop quads that straddle a depth discontinuity. The 2x2
+        # corner windows are a zero-copy view, and the cached face array lists
+        # all first triangles then all second triangles in the same row-major
+        # quad order, so one flat mask indexes both halves.
+        if depth_gap_threshold is not None:
+            from numpy.lib.stride_tricks import sliding_window_view
+            quads = sliding_window_view(depth_smooth, (2, 2))
+            gap = (quads.max(axis=(-1, -2)) - quads.min(axis=(-1, -2))).ravel()
+            keep = gap <= depth_gap_threshold
+            if not keep.all():
+                log.debug("  ✂️  Dropping %d/%d quads across depth discontinuities",
+                          int((~keep).sum()), keep.size)
+                faces = faces[np.concatenate([keep, keep])]
 
         # Try to build a UV-textured mesh using the original full-res image
         # so the texture exactly matches the 2D source photo.
         mesh = None
         if image_path is not None:
             try:
-                from PIL import Image as PILImage
-                pil_img = PILImage.open(image_path).convert("RGB")
+                pil_img = Image.open(image_path).convert("RGB")
                 material = trimesh.visual.material.SimpleMaterial(image=pil_img)
                 texture_visuals = trimesh.visual.TextureVisuals(
                     uv=uv_coords,
@@ -194,9 +351,9 @@ class MeshGenerator:
                     visual=texture_visuals,
                     process=False  # Keep vertex order for UV correctness
                 )
-                print("  🖼️  UV-textured mesh created from original image")
+                log.debug("  🖼️  UV-textured mesh created from original image")
             except Exception as tex_err:
-                print(f"  ⚠️  UV texture failed ({tex_err}), falling back to vertex colors")
+                log.warning("  ⚠️  UV texture failed (%s), falling back to vertex colors", tex_err)
                 mesh = None
 
         if mesh is None:
@@ -206,9 +363,12 @@ class MeshGenerator:
                 vertices=vertices,
                 faces=faces,
                 vertex_colors=vertex_colors,
-                process=True
+                # Structured grid: vertices are unique and faces well-formed by
+                # construction, so trimesh's merge/degenerate passes are wasted
+                # work (and keeping vertex order preserves the color mapping).
+                process=False
             )
-            print("  🎨 Vertex-colored mesh created")
+            log.debug("  🎨 Vertex-colored mesh created")
 
         return mesh
 
@@ -315,33 +475,31 @@ class MeshGenerator:
         front_mesh = None
         if image_path is not None:
             try:
-                from PIL import Image as PILImage
-                pil_img  = PILImage.open(image_path).convert("RGB")
+                pil_img  = Image.open(image_path).convert("RGB")
                 material = trimesh.visual.material.SimpleMaterial(image=pil_img)
                 tex_vis  = trimesh.visual.TextureVisuals(uv=front_uvs, material=material)
                 front_mesh = trimesh.Trimesh(
                     vertices=front_verts, faces=front_faces,
                     visual=tex_vis, process=False
                 )
-                print(f"  🖼️  Front face UV-textured ({res_x}×{res_y} grid, original image)")
+                log.debug("  🖼️  Front face UV-textured (%s×%s grid, original image)", res_x, res_y)
             except Exception as tex_err:
-                print(f"  ⚠️  UV texture failed ({tex_err}), using hi-res vertex colours")
+                log.warning("  ⚠️  UV texture failed (%s), using hi-res vertex colours", tex_err)
 
         if front_mesh is None:
             front_mesh = trimesh.Trimesh(
                 vertices=front_verts, faces=front_faces,
                 vertex_colors=front_colors, process=False
             )
-            print(f"  🎨  Front face vertex-coloured ({res_x}×{res_y} grid)")
+            log.debug("  🎨  Front face vertex-coloured (%s×%s grid)", res_x, res_y)
 
         scene.add_geometry(front_mesh, node_name='front_face')
 
         # ── Helper: coloured quad added directly to the scene ─────────────
         def add_quad(name, p0, p1, p2, p3, color):
             verts  = np.array([p0, p1, p2, p3], dtype=np.float32)
-            faces  = np.array([[0, 1, 2], [0, 2, 3]], dtype=np.int32)
             colors = np.tile(np.append(color, 255), (4, 1)).astype(np.uint8)
-            m = trimesh.Trimesh(vertices=verts, faces=faces,
+            m = trimesh.Trimesh(vertices=verts, faces=_QUAD_TRIS,
                                 vertex_colors=colors, process=False)
             scene.add_geometry(m, node_name=name)
 
@@ -379,9 +537,9 @@ class MeshGenerator:
                  ground_color)
 
         total_faces = sum(len(g.faces) for g in scene.geometry.values())
-        print(f"  ✅ Facade Scene: {len(scene.geometry)} meshes, "
-              f"{total_faces} total faces | "
-              f"roof_y={roof_y:.2f}, ground_y={ground_y:.2f}, depth={building_d:.2f}")
+        log.debug("  ✅ Facade Scene: %d meshes, %d total faces | "
+                  "roof_y=%.2f, ground_y=%.2f, depth=%.2f",
+                  len(scene.geometry), total_faces, roof_y, ground_y, building_d)
         return scene
 
     def _architectural_mesh(self, depth_map, image, width, height,
@@ -420,12 +578,12 @@ class MeshGenerator:
             target_dim = res_cap
             tw = int(width * target_dim / max_dimension)
             th = int(height * target_dim / max_dimension)
-            print(f"  🔽 Downsampling for wall detection: {width}x{height} → {tw}x{th} (INTER_NEAREST)")
+            log.debug("  🔽 Downsampling for wall detection: %sx%s → %sx%s (INTER_NEAREST)", width, height, tw, th)
             depth_map_small = cv2.resize(depth_map, (tw, th), interpolation=cv2.INTER_NEAREST)
             image_small = cv2.resize(image, (tw, th), interpolation=cv2.INTER_AREA)
             h_small, w_small = th, tw
         else:
-            print(f"  ✅ Using full resolution: {width}x{height} for maximum architectural detail")
+            log.debug("  ✅ Using full resolution: %sx%s for maximum architectural detail", width, height)
             depth_map_small = depth_map
             image_small = image
             h_small, w_small = height, width
@@ -436,7 +594,7 @@ class MeshGenerator:
         # Find contours of wall regions
         contours, hierarchy = cv2.findContours(wall_mask, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE)
 
-        print(f"  🔍 Found {len(contours)} wall contours")
+        log.debug("  🔍 Found %s wall contours", len(contours))
 
         # Architectural parameters — Y-up, floor plan in XZ plane, walls extrude +Y
         # When a real-world scale is applied (scale_factor != 1), ceiling is 3.0m.
@@ -445,8 +603,8 @@ class MeshGenerator:
         ceiling_height = 3.0 if has_real_scale else 2.5
         floor_height = 0.0
         wall_thickness = 0.08 * max(scale_factor_x, scale_factor_z) if has_real_scale else 0.08
-        print(f"  📐 Y-up: Floor=XZ (Y={floor_height}), Ceiling Y={ceiling_height:.2f}, "
-              f"scale=({scale_factor_x:.2f}, {scale_factor_z:.2f})")
+        log.debug("  📐 Y-up: Floor=XZ (Y=%s), Ceiling Y=%.2f, scale=(%.2f, %.2f)",
+                  floor_height, ceiling_height, scale_factor_x, scale_factor_z)
 
         # Map pixel coordinates to 3D world space.
         if has_real_scale:
@@ -471,58 +629,46 @@ class MeshGenerator:
             offset_x = -half_x
             offset_z = -half_z
 
-        vertices = []
-        faces = []
-        colors = []
-        wall_vertex_count = 0
+        # Geometry is accumulated as whole NumPy blocks (one per wall batch /
+        # floor region) and concatenated once at the end — far cheaper than
+        # per-quad Python list appends on plans with hundreds of segments.
+        vert_blocks = []
+        face_blocks = []
+        color_blocks = []
         vertex_offset = 0
 
-        def _add_wall_quad(xa, za, xb, zb, y_bot, y_top, color):
+        def _emit_wall_quads(xa, za, xb, zb, y_bot, y_top, color):
             nonlocal vertex_offset
-            if y_top <= y_bot:
+            block = self._wall_quad_block(
+                xa, za, xb, zb, y_bot, y_top, color,
+                wall_thickness, ceiling_height, vertex_offset
+            )
+            if block is None:
                 return
-            seg_dx = xb - xa;  seg_dz = zb - za
-            seg_len = max(np.sqrt(seg_dx**2 + seg_dz**2), 1e-6)
-            # Perpendicular offset for wall thickness (inner face)
-            nx = seg_dz / seg_len * wall_thickness
-            nz = -seg_dx / seg_len * wall_thickness
-            inner_c = [min(255, int(c) + 15) for c in color]
-            top_c   = [min(255, int(c) + 30) for c in color]
-
-            # Outer face
-            vertices.extend([[xa, y_bot, za], [xb, y_bot, zb], [xb, y_top, zb], [xa, y_top, za]])
-            colors.extend([color] * 4)
-            b = vertex_offset
-            faces.extend([[b, b+1, b+2], [b, b+2, b+3]])
-            vertex_offset += 4
-
-            # Inner face (reversed winding so normal faces inward)
-            vertices.extend([[xa+nx, y_bot, za+nz], [xb+nx, y_bot, zb+nz],
-                              [xb+nx, y_top, zb+nz], [xa+nx, y_top, za+nz]])
-            colors.extend([inner_c] * 4)
-            b = vertex_offset
-            faces.extend([[b+2, b+1, b], [b+3, b+2, b]])
-            vertex_offset += 4
-
-            # Top cap (only at full ceiling height to avoid floating caps on lintels)
-            if abs(y_top - ceiling_height) < 0.05:
-                vertices.extend([[xa, y_top, za], [xb, y_top, zb],
-                                  [xb+nx, y_top, zb+nz], [xa+nx, y_top, za+nz]])
-                colors.extend([top_c] * 4)
-                b = vertex_offset
-                faces.extend([[b, b+1, b+2], [b, b+2, b+3]])
-                vertex_offset += 4
+            bv, bf, bc = block
+            vert_blocks.append(bv)
+            face_blocks.append(bf)
+            color_blocks.append(bc)
+            vertex_offset += len(bv)
 
         min_contour_perimeter = min(w_small, h_small) * 0.04
 
-        for contour_idx, contour in enumerate(contours):
-            if len(contour) < 4:
-                continue
-
-            perimeter = cv2.arcLength(contour, True)
-            if perimeter < min_contour_perimeter:
-                continue
-
+        # Pixel→world lookup tables, computed once per call: contour vertices
+        # are integer pixel coordinates, so per-contour transforms reduce to
+        # fancy indexing instead of repeating the scale/offset arithmetic.
+        xs_lut = np.arange(w_small, dtype=np.float32) * scale_x + offset_x
+        zs_lut = -(np.arange(h_small, dtype=np.float32) * scale_z + offset_z)
+
+        # Prefilter noise contours up front — point count is a free proxy that
+        # spares tiny specks the arcLength call, and the perimeter cut drops
+        # the rest before any approxPolyDP / color sampling work.
+        survivors = [(c, p) for c, p in
+                     ((c, cv2.arcLength(c, True)) for c in contours if len(c) >= 4)
+                     if p >= min_contour_perimeter]
+        if len(survivors) < len(contours):
+            log.debug("  🧹 Contour prefilter: %d → %d", len(contours), len(survivors))
+
+        for contour, perimeter in survivors:
             epsilon = eps_factor * perimeter
             approx = cv2.approxPolyDP(contour, epsilon, True)
 
@@ -531,56 +677,71 @@ class MeshGenerator:
 
             # Sample wall color from floor plan image at contour location
             # Use median color along the contour for realistic appearance
-            contour_colors = []
-            for point in approx:
-                px, py = point[0]
-                if 0 <= py < h_small and 0 <= px < w_small:
-                    contour_colors.append(image_small[py, px])
+            pts = approx.reshape(-1, 2)
+            in_bounds = ((pts[:, 0] >= 0) & (pts[:, 0] < w_small) &
+                         (pts[:, 1] >= 0) & (pts[:, 1] < h_small))
+            contour_colors = image_small[pts[in_bounds, 1], pts[in_bounds, 0]]
             wall_color = (np.median(contour_colors, axis=0).astype(np.uint8).tolist()
-                          if contour_colors else [120, 120, 120])
+                          if len(contour_colors) else _WALL_FALLBACK_COLOR)
 
             door_top = min(2.1 * (ceiling_height / 3.0), ceiling_height - 0.1)
 
-            seg_count = len(approx)
+            # Transform every polygon vertex to world space via the LUTs
+            # (contour points are integer pixels, always in bounds);
+            # np.roll pairs each vertex with the next (closed polygon).
+            x1s = xs_lut[pts[:, 0]]
+            z1s = zs_lut[pts[:, 1]]
+            x2s = np.roll(x1s, -1)
+            z2s = np.roll(z1s, -1)
+
+            # Opening detection still walks segments (it samples image pixels),
+            # but only the segment *endpoints* are collected here; the actual
+            # quad geometry is emitted in two batched calls per contour.
+            full_quads = []    # (xa, za, xb, zb) at full wall height
+            lintel_quads = []  # (xa, za, xb, zb) spanning door_top → ceiling
+            seg_count = len(pts)
             for i in range(seg_count):
-                p1 = approx[i][0]
-                p2 = approx[(i + 1) % seg_count][0]
-
-                x1 = p1[0] * scale_x + offset_x
-                z1 = -(p1[1] * scale_z + offset_z)
-                x2 = p2[0] * scale_x + offset_x
-                z2 = -(p2[1] * scale_z + offset_z)
+                p1 = pts[i]
+                p2 = pts[(i + 1) % seg_count]
+                x1, z1, x2, z2 = x1s[i], z1s[i], x2s[i], z2s[i]
 
                 openings = self._detect_segment_openings(
                     image_small, p1[0], p1[1], p2[0], p2[1], h_small, w_small
                 )
 
                 if not openings:
-                    _add_wall_quad(x1, z1, x2, z2, floor_height, ceiling_height, wall_color)
+                    full_quads.append((x1, z1, x2, z2))
                 else:
                     prev_t = 0.0
                     for gap_s, gap_e in openings:
                         # Solid wall section before this opening
                         if gap_s > prev_t + 0.02:
-                            xa = x1 + (x2 - x1) * prev_t;  za = z1 + (z2 - z1) * prev_t
-                            xb = x1 + (x2 - x1) * gap_s;   zb = z1 + (z2 - z1) * gap_s
-                            _add_wall_quad(xa, za, xb, zb, floor_height, ceiling_height, wall_color)
+                            full_quads.append((x1 + (x2 - x1) * prev_t, z1 + (z2 - z1) * prev_t,
+                                               x1 + (x2 - x1) * gap_s,  z1 + (z2 - z1) * gap_s))
                         # Lintel only over the opening (door height to ceiling)
-                        xc = x1 + (x2 - x1) * gap_s;  zc = z1 + (z2 - z1) * gap_s
-                        xd = x1 + (x2 - x1) * gap_e;  zd = z1 + (z2 - z1) * gap_e
-                        lintel_c = [min(255, int(c) + 25) for c in wall_color]
-                        _add_wall_quad(xc, zc, xd, zd, door_top, ceiling_height, lintel_c)
+                        lintel_quads.append((x1 + (x2 - x1) * gap_s, z1 + (z2 - z1) * gap_s,
+                                             x1 + (x2 - x1) * gap_e, z1 + (z2 - z1) * gap_e))
                         prev_t = gap_e
                     # Solid wall section after last opening
                     if prev_t < 0.98:
-                        xa = x1 + (x2 - x1) * prev_t;  za = z1 + (z2 - z1) * prev_t
-                        _add_wall_quad(xa, za, x2, z2, floor_height, ceiling_height, wall_color)
+                        full_quads.append((x1 + (x2 - x1) * prev_t, z1 + (z2 - z1) * prev_t,
+                                           x2, z2))
+
+            if full_quads:
+                fq = np.array(full_quads, dtype=np.float32)
+                _emit_wall_quads(fq[:, 0], fq[:, 1], fq[:, 2], fq[:, 3],
+                                 floor_height, ceiling_height, wall_color)
+            if lintel_quads:
+                lq = np.array(lintel_quads, dtype=np.float32)
+                lintel_c = [min(255, int(c) + 25) for c in wall_color]
+                _emit_wall_quads(lq[:, 0], lq[:, 1], lq[:, 2], lq[:, 3],
+                                 door_top, ceiling_height, lintel_c)
 
         wall_vertex_count = vertex_offset  # all verts so far are wall geometry
 
         # Fallback: no usable wall geometry extracted from this depth map
         if wall_vertex_count == 0:
-            print("  ⚠️  No wall geometry from contours — retrying with lower threshold")
+            log.warning("  ⚠️  No wall geometry from contours — retrying with lower threshold")
             wall_mask_retry = (depth_map_small > 0.3).astype(np.uint8) * 255
             contours_retry, _ = cv2.findContours(
                 wall_mask_retry, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE
@@ -591,7 +752,7 @@ class MeshGenerator:
                 return self._architectural_mesh(depth_retry, img_retry, w_small, h_small,
                                                scale_factor_x, scale_factor_z,
                                                complexity, generate_interiors)
-            print("  ⚠️  Still no walls — falling back to depth heightmap")
+            log.warning("  ⚠️  Still no walls — falling back to depth heightmap")
             return self._depth_to_mesh(depth_map, image, width, height, image_path=None)
 
         # Room-colored floors — one color per detected room (interior detail).
@@ -604,36 +765,143 @@ class MeshGenerator:
             )
         if room_data is not None:
             rv, rf, rc = room_data
-            rf_shifted = rf + vertex_offset
-            vertices.extend(rv.tolist())
-            faces.extend(rf_shifted.tolist())
-            colors.extend(rc.tolist())
+            vert_blocks.append(rv.astype(np.float32))
+            face_blocks.append((rf + vertex_offset).astype(np.int32))
+            color_blocks.append(rc.astype(np.uint8))
             vertex_offset += len(rv)
         else:
             # Single warm-beige floor slab spanning the (aspect-correct) footprint
-            vertices.extend([[-half_x, floor_height, -half_z], [ half_x, floor_height, -half_z],
-                              [ half_x, floor_height,  half_z], [-half_x, floor_height,  half_z]])
-            colors.extend([[230, 215, 190]] * 4)
             b = vertex_offset
-            faces.extend([[b, b+1, b+2], [b, b+2, b+3]])
+            vert_blocks.append(np.array(
+                [[-half_x, floor_height, -half_z], [ half_x, floor_height, -half_z],
+                 [ half_x, floor_height,  half_z], [-half_x, floor_height,  half_z]],
+                dtype=np.float32))
+            face_blocks.append(_QUAD_TRIS + b)
+            color_blocks.append(np.full((4, 3), _SLAB_COLOR, dtype=np.uint8))
             vertex_offset += 4
 
-        vertices = np.array(vertices, dtype=np.float32)
-        faces = np.array(faces, dtype=np.int32)
-        colors = np.array(colors, dtype=np.uint8)
+        vertices = np.concatenate(vert_blocks, axis=0)
+        faces = np.concatenate(face_blocks, axis=0)
+        colors = np.concatenate(color_blocks, axis=0)
 
-        print(f"  ✅ Generated {len(vertices)} vertices, {len(faces)} faces for architectural mesh")
+        # Adjacent wall segments share corner points top and bottom, so the
+        # raw quad soup carries ~2x the needed vertices. Merge them here with
+        # a cheap integer-key unique (mm precision) instead of leaving it to
+        # trimesh's general-purpose process=True pass.
+        n_raw = len(vertices)
+        vertices, faces, colors = self._dedupe_vertices(vertices, faces, colors)
 
-        # Create trimesh
+        log.debug("  ✅ Generated %s vertices (%s before corner merge), %s faces for architectural mesh",
+                  len(vertices), n_raw, len(faces))
+
+        # Create trimesh — merging already done above
         mesh = trimesh.Trimesh(
             vertices=vertices,
             faces=faces,
             vertex_colors=colors,
-            process=True
+            process=False
         )
 
         return mesh
 
+    @staticmethod
+    def _dedupe_vertices(vertices, faces, colors, precision=1e-3):
+        """
+        Merge vertices that coincide within `precision` (default 1mm in world
+        units) and remap faces accordingly.
+
+        Positions are quantized to integers and packed three-per-int64 so the
+        merge is a single np.unique over scalar keys — no spatial hashing.
+        The first occurrence wins for position and color, matching what
+        trimesh's merge_vertices picks.
+        """
+        quant = np.round(vertices / precision).astype(np.int64)
+        quant += 1 << 20  # shift into positive range for bit-packing
+        packed = (quant[:, 0] << 42) | (quant[:, 1] << 21) | quant[:, 2]
+        _, first_idx, inverse = np.unique(packed, return_index=True,
+                                          return_inverse=True)
+        return (vertices[first_idx],
+                inverse[faces].astype(np.int32),
+                colors[first_idx])
+
+    def _wall_quad_block(self, xa, za, xb, zb, y_bot, y_top, color,
+                         wall_thickness, ceiling_height, base_index):
+        """
+        Build extruded wall geometry for a batch of segments in one shot.
+
+        Every segment gets an outer face, a thickness-offset inner face
+        (reversed winding) and — at full ceiling height — a top cap, exactly
+        as the old per-segment helper emitted them, but the corner positions,
+        face indices and colors are assembled as whole NumPy blocks instead of
+        ~10 list appends per segment.
+
+        Args:
+            xa, za, xb, zb: Segment endpoint arrays (S,)
+            y_bot, y_top: Extrusion heights (scalar, shared by the batch)
+            color: Base RGB wall color for the batch
+            wall_thickness: Perpendicular inner-face offset
+            ceiling_height: Full wall height (controls the top cap)
+            base_index: Vertex index the batch starts at
+
+        Returns:
+            (verts, faces, colors) arrays, or None for an empty/flat batch
+        """
+        if y_top <= y_bot or len(xa) == 0:
+            return None
+
+        xa = np.asarray(xa, dtype=np.float32)
+        za = np.asarray(za, dtype=np.float32)
+        xb = np.asarray(xb, dtype=np.float32)
+        zb = np.asarray(zb, dtype=np.float32)
+
+        seg_dx = xb - xa
+        seg_dz = zb - za
+        seg_len = np.maximum(np.sqrt(seg_dx ** 2 + seg_dz ** 2), 1e-6)
+        # Perpendicular offset for wall thickness (inner face)
+        nx = seg_dz / seg_len * wall_thickness
+        nz = -seg_dx / seg_len * wall_thickness
+        xan, zan = xa + nx, za + nz
+        xbn, zbn = xb + nx, zb + nz
+
+        # Top cap only at full ceiling height to avoid floating caps on lintels
+        has_cap = abs(y_top - ceiling_height) < 0.05
+        verts_per_seg = 12 if has_cap else 8
+        n_seg = len(xa)
+
+        corners = [
+            (xa,  y_bot, za),  (xb,  y_bot, zb),   # outer face
+            (xb,  y_top, zb),  (xa,  y_top, za),
+            (xan, y_bot, zan), (xbn, y_bot, zbn),  # inner face
+            (xbn, y_top, zbn), (xan, y_top, zan),
+        ]
+        if has_cap:
+            corners += [
+                (xa,  y_top, za),  (xb,  y_top, zb),
+                (xbn, y_top, zbn), (xan, y_top, zan),
+            ]
+
+        verts = np.empty((n_seg, verts_per_seg, 3), dtype=np.float32)
+        for ci, (cx, cy, cz) in enumerate(corners):
+            verts[:, ci, 0] = cx
+            verts[:, ci, 1] = cy
+            verts[:, ci, 2] = cz
+
+        # Outer CCW, inner reversed so its normal faces inward, cap on top
+        template = _WALL_TRIS_CAPPED if has_cap else _WALL_TRIS
+        offsets = base_index + verts_per_seg * np.arange(n_seg, dtype=np.int32)
+        faces = (template[np.newaxis, :, :] + offsets[:, np.newaxis, np.newaxis])
+
+        color = np.asarray(color, dtype=np.int32)
+        seg_colors = np.empty((verts_per_seg, 3), dtype=np.uint8)
+        seg_colors[0:4] = color
+        seg_colors[4:8] = np.minimum(255, color + 15)   # inner face
+        if has_cap:
+            seg_colors[8:12] = np.minimum(255, color + 30)  # top cap
+
+        return (verts.reshape(-1, 3),
+                faces.reshape(-1, 3),
+                np.tile(seg_colors, (n_seg, 1)))
+
     def _detect_segment_openings(self, image, px1, py1, px2, py2, h, w):
         """
         Sample image brightness along a wall contour segment to find door/window
@@ -686,17 +954,6 @@ class MeshGenerator:
         )
 
         total_area = h * w
-        # Architect-friendly palette: warm, distinct, low-saturation tones
-        PALETTE = [
-            [232, 218, 200],  # tan — unlabelled background floor
-            [248, 238, 220],  # cream — living / main room
-            [218, 232, 246],  # sky blue — bedroom
-            [228, 244, 222],  # sage — kitchen / dining
-            [246, 232, 220],  # peach — bedroom 2
-            [234, 220, 246],  # lavender — study / office
-            [220, 244, 238],  # mint — bathroom
-            [244, 240, 218],  # pale gold — utility / laundry
-        ]
 
         # Sort rooms largest → smallest so the main room gets the "cream" color
         room_list = sorted(
@@ -705,46 +962,55 @@ class MeshGenerator:
              if stats[idx, cv2.CC_STAT_AREA] >= total_area * 0.003],
             key=lambda x: -x[1]
         )
-        label_color = {lbl: PALETTE[min(rank + 1, len(PALETTE) - 1)]
-                       for rank, (lbl, _) in enumerate(room_list)}
-
         if not room_list:
             return None
 
-        print(f"  🏘️  Room detection: {len(room_list)} rooms found")
+        log.debug("  🏘️  Room detection: %s rooms found", len(room_list))
+
+        # Label → color lookup table: row 0 stays the background tan, ranked
+        # rooms get the palette rows (largest room first)
+        color_lut = np.tile(_ROOM_PALETTE[0], (num_labels, 1))
+        for rank, (lbl, _) in enumerate(room_list):
+            color_lut[lbl] = _ROOM_PALETTE[min(rank + 1, len(_ROOM_PALETTE) - 1)]
 
+        # Build the whole tile grid in one batch: sample every tile center,
+        # keep those on floor, and assemble the (n, 4, 3) quad vertices by
+        # broadcasting — no per-tile Python iteration.
         step = max(3, min(w, h) // 64)
-        verts, face_list, col_list = [], [], []
-        v_off = 0
-
-        for py in range(0, h - step, step):
-            for px in range(0, w - step, step):
-                cy, cx = py + step // 2, px + step // 2
-                if cy >= h or cx >= w:
-                    continue
-                if floor_mask[cy, cx] == 0:
-                    continue  # skip wall area
-                lbl = int(labels[cy, cx]) if cy < labels.shape[0] and cx < labels.shape[1] else 0
-                color = label_color.get(lbl, PALETTE[0])
-
-                x0 = px * scale_x + offset_x
-                x1 = min(px + step, w) * scale_x + offset_x
-                z0 = -(py * scale_z + offset_z)
-                z1 = -(min(py + step, h) * scale_z + offset_z)
-
-                verts.extend([[x0, floor_height, z0], [x1, floor_height, z0],
-                               [x1, floor_height, z1], [x0, floor_height, z1]])
-                col_list.extend([color] * 4)
-                b = v_off
-                face_list.extend([[b, b+1, b+2], [b, b+2, b+3]])
-                v_off += 4
-
-        if not verts:
+        pys = np.arange(0, h - step, step)
+        pxs = np.arange(0, w - step, step)
+        if len(pys) == 0 or len(pxs) == 0:
             return None
 
-        return (np.array(verts,      dtype=np.float32),
-                np.array(face_list,  dtype=np.int32),
-                np.array(col_list,   dtype=np.uint8))
+        cy, cx = pys + step // 2, pxs + step // 2
+        on_floor = floor_mask[np.ix_(cy, cx)] != 0
+        if not on_floor.any():
+            return None
+
+        tile_labels = labels[np.ix_(cy, cx)][on_floor]
+        tile_colors = color_lut[tile_labels]
+
+        x0g, z0g = np.meshgrid(pxs * scale_x + offset_x,
+                               -(pys * scale_z + offset_z), indexing='xy')
+        x1g, z1g = np.meshgrid((pxs + step) * scale_x + offset_x,
+                               -((pys + step) * scale_z + offset_z), indexing='xy')
+        x0, z0 = x0g[on_floor], z0g[on_floor]
+        x1, z1 = x1g[on_floor], z1g[on_floor]
+
+        n_tiles = len(x0)
+        verts = np.empty((n_tiles, 4, 3), dtype=np.float32)
+        verts[:, :, 1] = floor_height
+        verts[:, 0, 0] = x0;  verts[:, 0, 2] = z0
+        verts[:, 1, 0] = x1;  verts[:, 1, 2] = z0
+        verts[:, 2, 0] = x1;  verts[:, 2, 2] = z1
+        verts[:, 3, 0] = x0;  verts[:, 3, 2] = z1
+
+        offsets = (4 * np.arange(n_tiles, dtype=np.int32))[:, None, None]
+        faces = (_QUAD_TRIS[None, :, :] + offsets).reshape(-1, 3)
+
+        return (verts.reshape(-1, 3),
+                faces,
+                np.repeat(tile_colors, 4, axis=0).astype(np.uint8))
 
     def create_textured_mesh(self, mesh, image_data):
         """
@@ -771,10 +1037,125 @@ class MeshGenerator:
         Returns:
             subdivided_mesh
         """
+        # Work on the raw arrays: mesh.subdivide() rebuilds a full Trimesh
+        # (with its process=True vertex hashing) every iteration, while
+        # trimesh.remesh.subdivide is pure array math. Both per-vertex visual
+        # kinds ride along as vertex attributes (midpoints interpolated):
+        # vertex colors directly, UVs re-wrapped with the original material.
+        # Anything else (face colors, etc.) keeps the slower mesh.subdivide()
+        # path, which knows how to carry every visual kind.
+        visual = mesh.visual
+        attributes = None
+        uv_material = None
+        if (isinstance(visual, trimesh.visual.TextureVisuals)
+                and visual.uv is not None):
+            attributes = {'uv': np.asarray(visual.uv)}
+            uv_material = visual.material
+        elif (isinstance(visual, trimesh.visual.ColorVisuals)
+                and visual.kind == 'vertex'):
+            attributes = {'color': np.asarray(visual.vertex_colors)}
+        elif getattr(visual, 'kind', None) is not None:
+            for _ in range(iterations):
+                mesh = mesh.subdivide()
+            return mesh
+
+        vertices, faces = mesh.vertices, mesh.faces
         for _ in range(iterations):
-            mesh = mesh.subdivide()
+            if attributes is not None:
+                vertices, faces, attributes = trimesh.remesh.subdivide(
+                    vertices, faces, vertex_attributes=attributes
+                )
+            else:
+                vertices, faces = trimesh.remesh.subdivide(vertices, faces)
+
+        if uv_material is not None:
+            out = trimesh.Trimesh(
+                vertices=vertices, faces=faces,
+                visual=trimesh.visual.TextureVisuals(uv=attributes['uv'],
+                                                     material=uv_material),
+                process=False  # keep vertex order for UV correctness
+            )
+        else:
+            out = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+            if attributes is not None:
+                # subdivide interpolates the colors as float64 in the 0-255
+                # range, but the vertex_colors setter scales float input as
+                # 0-1 — cast back to uint8 so channels aren't blown to 255
+                out.visual.vertex_colors = np.clip(
+                    np.round(attributes['color']), 0, 255
+                ).astype(np.uint8)
+        return out
+
+    def subdivide_grid_mesh(self, depth_map, image, iterations=1, depth_scale=1.5):
+        """
+        Subdivide a heightmap grid mesh by upsampling its source data.
 
-        return mesh
+        Generic subdivision (subdivide_mesh) re-triangulates arbitrary
+        connectivity; for the regular grid the same refinement is just
+        midpoint interpolation, i.e. resizing depth and image to (2W-1, 2H-1)
+        and rebuilding from the cached grid topology — pure cv2/NumPy work
+        with no per-iteration mesh reconstruction.
+
+        Args:
+            depth_map: 2D depth values the mesh was built from
+            image: RGB image matching the depth map
+            iterations: Number of subdivision iterations
+            depth_scale: Depth extrusion factor (matches _depth_to_mesh)
+
+        Returns:
+            mesh: Vertex-colored Trimesh at the subdivided resolution
+        """
+        depth_map = depth_map.astype(np.float32, copy=False)
+        for _ in range(iterations):
+            h, w = depth_map.shape
+            new_w, new_h = 2 * w - 1, 2 * h - 1
+            depth_map = cv2.resize(depth_map, (new_w, new_h),
+                                   interpolation=cv2.INTER_LINEAR)
+            image = cv2.resize(image, (new_w, new_h),
+                               interpolation=cv2.INTER_LINEAR)
+
+        height, width = depth_map.shape
+        x_flat, y_flat = _grid_coords(width, height)
+        _, faces = _grid_topology(width, height)
+        vertices = np.empty((height * width, 3), dtype=np.float32)
+        vertices[:, 0] = x_flat
+        vertices[:, 1] = y_flat
+        np.multiply(depth_map.ravel(), depth_scale, out=vertices[:, 2])
+
+        return trimesh.Trimesh(
+            vertices=vertices,
+            faces=faces,
+            vertex_colors=image.reshape(-1, 3),
+            process=False
+        )
+
+    def _neighbor_average_matrix(self, mesh):
+        """
+        Row-normalized vertex adjacency as a sparse CSR matrix.
+
+        Multiplying this by the (V, 3) vertex array replaces every vertex with
+        the mean of its neighbors in one BLAS-backed pass. Topology doesn't
+        change during smoothing, so the matrix is built once per mesh.
+        """
+        from scipy import sparse
+
+        n = len(mesh.vertices)
+        edges = mesh.edges_unique
+        rows = np.concatenate([edges[:, 0], edges[:, 1]])
+        cols = np.concatenate([edges[:, 1], edges[:, 0]])
+        adjacency = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=(n, n)
+        )
+
+        degree = np.asarray(adjacency.sum(axis=1)).ravel()
+        isolated = degree == 0
+        inv_degree = np.zeros_like(degree)
+        inv_degree[~isolated] = 1.0 / degree[~isolated]
+        averaging = sparse.diags(inv_degree) @ adjacency
+        if isolated.any():
+            # Vertices with no neighbors keep their position
+            averaging = averaging + sparse.diags(isolated.astype(np.float32))
+        return averaging.tocsr()
 
     def smooth_mesh(self, mesh, iterations=1):
         """
@@ -787,17 +1168,41 @@ class MeshGenerator:
         Returns:
             smoothed_mesh
         """
-        # Trimesh doesn't have built-in Laplacian smoothing
-        # We can approximate it by averaging vertex positions
+        # Trimesh doesn't have built-in Laplacian smoothing. Each iteration
+        # replaces every vertex by the mean of its neighbors — one sparse
+        # mat-vec per pass instead of a Python loop over vertices.
+        averaging = self._neighbor_average_matrix(mesh)
+        vertices = mesh.vertices
         for _ in range(iterations):
-            vertices = mesh.vertices.copy()
-            vertex_neighbors = mesh.vertex_neighbors
-            
-            for i, neighbors in enumerate(vertex_neighbors):
-                if len(neighbors) > 0:
-                    vertices[i] = np.mean(mesh.vertices[neighbors], axis=0)
-            
-            mesh.vertices = vertices
+            vertices = averaging @ vertices
 
+        mesh.vertices = vertices
         # Normals are automatically recomputed by trimesh when accessed
         return mesh
+
+    def taubin_smooth(self, mesh, iterations=5, lam=0.5, mu=-0.53):
+        """
+        Apply Taubin (λ/μ) smoothing to mesh.
+
+        Alternates a shrinking Laplacian step (λ > 0) with an inflating step
+        (μ < 0), which smooths noise without the volume loss plain Laplacian
+        smoothing causes — so far fewer iterations are needed for the same
+        visual result.
+
+        Args:
+            mesh: Input trimesh
+            iterations: Number of λ/μ iteration pairs
+            lam: Positive smoothing factor
+            mu: Negative inflation factor (|mu| slightly > lam)
+
+        Returns:
+            smoothed_mesh
+        """
+        averaging = self._neighbor_average_matrix(mesh)
+        vertices = mesh.vertices
+        for _ in range(iterations):
+            vertices = vertices + lam * (averaging @ vertices - vertices)
+            vertices = vertices + mu * (averaging @ vertices - vertices)
+
+        mesh.vertices = vertices
+        return mesh